@@ -1,47 +1,15 @@
 import os
+import threading
 
-from fastapi import FastAPI, Query, HTTPException, Body, BackgroundTasks
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import subprocess
-from pydantic import ValidationError, SecretStr, HttpUrl
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
 import logging
-from lib.vcs.repo_manager import (
-    clone_repository,
-    add_repository,
-    delete_repository,
-    fetch_and_checkout_branch,
-    get_repo_info_async,
-    delete_store,
-    check_pull_access,
-    check_push_access,
-)
-from lib.vcs.git_commit_manager import GitCommitManager
-from lib.indexer.commit_indexer import CommitEmbeddingGenerator
-from lib.indexer.file_summary_indexer import FileSummaryGenerator
-from lib.search.commit_embedding_matcher import CommitEmbeddingMatcher
-from lib.search.file_embedding_matcher import FileEmbeddingMatcher
-from lib.utils.utilities import (
-    read_json_file,
-    write_json_file,
-    url_to_folder_name,
-    get_lock_file_path,
-    is_locked,
-    acquire_lock,
-    release_lock
-)
 
-from app.utils import DataDir, retrieve_file_contents, count_tokens, add_all_existing_repos_as_safe, delete_all_repo_lock_files
+from app.utils import DataDir, add_all_existing_repos_as_safe, delete_all_repo_lock_files
 from lib.utils.log_utils import reset_logs
-
-from typing import Optional, List, Dict
-from lib.utils.enums import (
-    SearchMode,
-    MatchStrength,
-    EmbeddingModel,
-    FilePathEntry,
-    VCSType,
-)
+from lib.utils.utilities import read_json_file_cached
 
 from app.routes import (
     test_pull_access,
@@ -60,9 +28,9 @@ from app.routes import (
     delete_store,
     file_edit,
     new_files,
+    health,
 )
 
-from app.routes.load import handle_load
 
 # Get log level from environment variable, default to INFO
 log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -75,7 +43,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# orjson serializes responses to bytes directly, well ahead of the stdlib
+# encoder on embedding-heavy payloads like /infer-file/.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 logger.critical("Application is starting up...")
@@ -87,31 +57,38 @@ model_path = os.path.join(models_dir, "all-MiniLM-L6-v2")
 # Ensure models directory exists
 os.makedirs(models_dir, exist_ok=True)
 
-# Check if model already exists
-if not os.path.exists(model_path):
-    logger.info(f"Cloning all-MiniLM-L6-v2 model into {model_path}")
+# Set once the model is available on disk; endpoints that need the local
+# model can wait on this instead of blocking server startup on the clone.
+model_ready = threading.Event()
+
+def _clone_model():
+    """ Shallow-clone the embeddings model in the background if missing. """
     try:
+        logger.info(f"Cloning all-MiniLM-L6-v2 model into {model_path}")
         subprocess.run(
-            ["git", "clone", "https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2", model_path],
+            [
+                "git", "clone", "--depth=1", "--single-branch",
+                "https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2",
+                model_path,
+            ],
             check=True
         )
         logger.info("Model cloned successfully")
+        model_ready.set()
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to clone model: {str(e)}")
+
+# Check if model already exists
+if not os.path.exists(model_path):
+    # Run the clone off the import path so uvicorn can bind immediately;
+    # history isn't needed for inference, so a depth-1 clone suffices.
+    threading.Thread(target=_clone_model, daemon=True).start()
 else:
     logger.info(f"Model already exists at {model_path}, skipping clone")
+    model_ready.set()
 
 add_all_existing_repos_as_safe("/data/users/repositories/")
 delete_all_repo_lock_files("/data/users/repositories/")
-# Reset logs for all existing repositories at startup
-for project_name in DataDir.list_projects():
-    try:
-        reset_logs(project_name)
-    except Exception as e:
-        logger.error(f"Failed to reset logs for project {project_name}: {e}")
-
-executor = ProcessPoolExecutor(max_workers=10)
-
 
 app.include_router(test_pull_access.router)
 app.include_router(status_route.router)
@@ -128,14 +105,41 @@ app.include_router(count_tokens_generate_response.router)
 app.include_router(delete_store.router)
 app.include_router(file_edit.router)
 app.include_router(new_files.router)
-
-app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
-
-@app.on_event("shutdown")
-def shutdown():
-    """ Shutdown the executor when the application terminates. """
-
-    logger.critical("Shutting down the executor.")
-    executor.shutdown(wait=True)
+app.include_router(health.router)
+
+@app.on_event("startup")
+async def startup_event():
+    """ Reset logs for all existing repositories concurrently at startup. """
+
+    # Consumer for the bounded indexing queue; needs the running loop.
+    load.start_load_worker()
+
+    projects = DataDir.list_projects()
+    if not projects:
+        return
+
+    results = await asyncio.gather(
+        *[asyncio.to_thread(reset_logs, project_name) for project_name in projects],
+        return_exceptions=True,
+    )
+    for project_name, result in zip(projects, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to reset logs for project {project_name}: {result}")
+
+    # Warm the parsed commits_logs cache so the first /infer-file/ or
+    # /get-file-summary/ request per project doesn't pay the full JSON
+    # parse. Embedding matchers can't be warmed here: they need the
+    # caller's API key, which only arrives with a request.
+    warm_results = await asyncio.gather(
+        *[
+            asyncio.to_thread(
+                read_json_file_cached,
+                os.path.join(DataDir.COMMITS_LOGS.get_path(project_name), "commits_logs.json"),
+            )
+            for project_name in projects
+        ],
+        return_exceptions=True,
+    )
+    for project_name, result in zip(projects, warm_results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to warm commits_logs cache for project {project_name}: {result}")
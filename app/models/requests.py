@@ -1,16 +1,26 @@
-from pydantic import BaseModel, HttpUrl, SecretStr, validator, Field
+from pydantic import AfterValidator, BaseModel, HttpUrl, SecretStr, Field
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Annotated, Optional, List, Dict
 from lib.utils.enums import VCSType
 
 # Default depth for commit history fetching
 DEFAULT_DEPTH_LEVEL = 10000
 
+
+def _non_empty_secret(v: SecretStr) -> SecretStr:
+    if not v.get_secret_value().strip():
+        raise ValueError("API key cannot be empty if provided")
+    return v
+
+# The emptiness rule compiles straight into the pydantic-core validator
+# graph, so one shared callable replaces a per-model validator method.
+NonEmptySecret = Annotated[SecretStr, AfterValidator(_non_empty_secret)]
+
 class CountTokenRequest(BaseModel):
     codehost_url: HttpUrl
     project_name: str
     vcs_type: VCSType = VCSType.git  # Default to "git"
-    api_key: Optional[SecretStr] = None
+    api_key: Optional[NonEmptySecret] = None
 
 class AmplificationLevel(str, Enum):
     OFF = "off"
@@ -23,8 +33,8 @@ class AddRepositoryRequest(BaseModel):
     project_name: str
     vcs_type: VCSType = VCSType.git  # Default to "git"
     ignore_files: List[str] = []  # Default to an empty list
-    api_key: Optional[SecretStr] = None
-    llm_model_api_key: Optional[SecretStr] = None
+    api_key: Optional[NonEmptySecret] = None
+    llm_model_api_key: Optional[NonEmptySecret] = None
     llm_model_base_url: HttpUrl
     llm_model: str
     head: str
@@ -33,18 +43,6 @@ class AddRepositoryRequest(BaseModel):
     depth_level: int = Field(default=DEFAULT_DEPTH_LEVEL, gt=0) # Added depth_level
     llm_threads: int
 
-    @validator('api_key')
-    def validate_api_key(cls, v):
-        if v and not v.get_secret_value().strip():
-            raise ValueError("API key cannot be empty if provided")
-        return v
-
-    @validator('llm_model_api_key')
-    def validate_api_key(cls, v):
-        if v and not v.get_secret_value().strip():
-            raise ValueError("API key cannot be empty if provided")
-        return v
-
 
 class LoadRequest(BaseModel):
     llm_model: Optional[str] = None
@@ -64,8 +62,8 @@ class DeleteStoreRequest(BaseModel):
     project_name: str
     codehost_url: HttpUrl
     vcs_type: VCSType
-    api_key: Optional[SecretStr] = None
-    llm_model_api_key: Optional[SecretStr] = None
+    api_key: Optional[NonEmptySecret] = None
+    llm_model_api_key: Optional[NonEmptySecret] = None
 
 
 class FetchAndCheckoutBranchRequest(BaseModel):
@@ -75,8 +73,8 @@ class FetchAndCheckoutBranchRequest(BaseModel):
     commit_oid: str  # New mandatory parameter
     ignore_files: List[str] = []  # Default to an empty list
     vcs_type: VCSType = VCSType.git  # Default to "git"
-    api_key: Optional[SecretStr] = None
-    llm_model_api_key: Optional[SecretStr] = None
+    api_key: Optional[NonEmptySecret] = None
+    llm_model_api_key: Optional[NonEmptySecret] = None
     llm_model_base_url: HttpUrl
     llm_model: str
     head: str
@@ -85,8 +83,3 @@ class FetchAndCheckoutBranchRequest(BaseModel):
     depth_level: int = Field(default=DEFAULT_DEPTH_LEVEL, gt=0)
     llm_threads: Optional[int] = None  # Add this field to control LLM concurrency
 
-    @validator('llm_model_api_key')
-    def validate_api_key(cls, v):
-        if v and not v.get_secret_value().strip():
-            raise ValueError("API key cannot be empty if provided")
-        return v
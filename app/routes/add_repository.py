@@ -1,9 +1,9 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from app.services.add_repository_service import process_add_repository
 from app.models.responses import AddRepositoryResponse, ErrorResponse
 from app.models.requests import AddRepositoryRequest
 from lib.utils.enums import VCSType  # Ensure you import VCSType for VS type checks
-from app.routes.load import handle_load
+from app.routes.load import enqueue_load
 from app.models.requests import LoadRequest  # Import the LoadRequest model
 from lib.vcs.git_content_manager import GitContentManager
 from app.utils import DataDir
@@ -14,18 +14,32 @@ import logging
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+
+def _secret_or_none(secret):
+    """Unwrap an Optional[SecretStr] once; blank values collapse to None."""
+    if secret is None:
+        return None
+    value = secret.get_secret_value()
+    return value if value.strip() else None
+
 @router.post("/add-repository/", response_model=AddRepositoryResponse, responses={500: {"model": ErrorResponse}})
-async def handle_add_repository(data: AddRepositoryRequest, background_tasks: BackgroundTasks):
+async def handle_add_repository(data: AddRepositoryRequest):
     try:
         response = await process_add_repository(data)
 
         logger.info(f"Calling add-repository route with use_mock_llm: {data.use_mock_llm}")
 
-        load_request = LoadRequest(
+        # Unwrap the SecretStr once instead of on every field below.
+        llm_model_api_key = _secret_or_none(data.llm_model_api_key)
+
+        # Every value below comes off an already-validated
+        # AddRepositoryRequest, so skip re-running the LoadRequest
+        # validators for this internal hand-off.
+        load_request = LoadRequest.model_construct(
             llm_model=data.llm_model,
             embeddings_model=None,
-            embeddings_model_api_key=data.llm_model_api_key.get_secret_value() if data.llm_model_api_key and data.llm_model_api_key.get_secret_value().strip() else None,
-            llm_model_api_key=data.llm_model_api_key.get_secret_value() if data.llm_model_api_key and data.llm_model_api_key.get_secret_value().strip() else None,
+            embeddings_model_api_key=llm_model_api_key,
+            llm_model_api_key=llm_model_api_key,
             llm_model_base_url=data.llm_model_base_url,
             project_name=data.project_name,
             ignore_files=data.ignore_files,
@@ -36,8 +50,8 @@ async def handle_add_repository(data: AddRepositoryRequest, background_tasks: Ba
             llm_threads=data.llm_threads  # Add thread parameter
         )
 
-        # Add the background task to handle loading
-        background_tasks.add_task(handle_load, load_request)
+        # Hand the indexing job to the bounded load queue.
+        enqueue_load(load_request)
 
         # Load above already results in commit
         # Add a task to commit the embedding file after handle_load is done
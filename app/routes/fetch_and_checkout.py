@@ -6,7 +6,7 @@ from lib.utils.utilities import url_to_folder_name, get_lock_file_path
 
 from lib.vcs.repo_manager import fetch_and_checkout_branch, fetch_and_checkout_commit
 from app.models.requests import LoadRequest, FetchAndCheckoutBranchRequest  # Import the LoadRequest model
-from app.routes.load import handle_load
+from app.routes.load import enqueue_load
 from app.models.responses import FetchAndCheckoutResponse  # Import the new response model
 
 router = APIRouter()
@@ -48,11 +48,17 @@ async def handle_fetch_and_checkout_branch(data: FetchAndCheckoutBranchRequest):
 
         logger.info(f"Calling load with use_mock_llm: {data.use_mock_llm}")
 
-        load_request = LoadRequest(
+        # Unwrap the SecretStr once instead of per field.
+        llm_model_api_key = data.llm_model_api_key.get_secret_value() if data.llm_model_api_key else None
+
+        # Fields come from the already-validated request model; skip the
+        # second validation pass for this internal hand-off, matching
+        # /add-repository/.
+        load_request = LoadRequest.model_construct(
             embeddings_model=None,
             llm_model=data.llm_model,
-            embeddings_model_api_key=data.llm_model_api_key.get_secret_value() if data.llm_model_api_key else None,
-            llm_model_api_key=data.llm_model_api_key.get_secret_value() if data.llm_model_api_key else None,
+            embeddings_model_api_key=llm_model_api_key,
+            llm_model_api_key=llm_model_api_key,
             llm_model_base_url=data.llm_model_base_url,
             project_name=project_name,
             ignore_files=data.ignore_files,
@@ -63,19 +69,17 @@ async def handle_fetch_and_checkout_branch(data: FetchAndCheckoutBranchRequest):
             llm_threads=data.llm_threads  # Add this line to pass the thread parameter
         )
 
-        result_load = await handle_load(load_request)
-
-        if result_load.get('status'):
+        # Index in the background like /add-repository/ does; the checkout
+        # itself is done, and /status/ reports indexing progress via the
+        # project lock.
+        enqueue_load(load_request)
 
-            return FetchAndCheckoutResponse(
-                message=f"Fetched and checked out {'branch ' + data.branch_name if data.branch_name else 'commit ' + data.commit_oid} for project '{data.project_name}' and updated index.",
-                branch_name=data.branch_name,
-                commit_oid=data.commit_oid,
-                project_name=data.project_name,
-            )
-        else:
-            logger.error(f"Load function returned an error: {result_load.get('error')}")
-            raise HTTPException(status_code=400, detail="Error generating embeddings.")
+        return FetchAndCheckoutResponse(
+            message=f"Fetched and checked out {'branch ' + data.branch_name if data.branch_name else 'commit ' + data.commit_oid} for project '{data.project_name}'; index update scheduled.",
+            branch_name=data.branch_name,
+            commit_oid=data.commit_oid,
+            project_name=data.project_name,
+        )
 
     except HTTPException as e:
         logger.error(f"HTTP Exception: {e.detail}")
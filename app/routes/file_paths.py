@@ -13,6 +13,14 @@ from lib.utils.enums import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Pre-validated once at import time; the handler only hands out references,
+# so no Pydantic validation runs on the request path.
+_MOCK_FILE_PATHS = [
+    FilePathEntry(path="/path/to/file1.txt"),
+    FilePathEntry(path="/path/to/file2.txt"),
+    FilePathEntry(path="/path/to/file3.txt")
+]
+
 @router.get("/file-paths/", response_model=FileSearchResponse)
 async def get_file_paths(
     prompt: str = Query(..., description="The prompt to search for"),
@@ -22,13 +30,12 @@ async def get_file_paths(
     if not prompt.strip():
         raise HTTPException(status_code=400, detail="Prompt cannot be empty.")
 
-    mock_file_paths = [
-        FilePathEntry(path="/path/to/file1.txt"),
-        FilePathEntry(path="/path/to/file2.txt"),
-        FilePathEntry(path="/path/to/file3.txt")
-    ]
-
-    return FileSearchResponse(
-        embedding_model=model,
+    # The inputs are already validated by FastAPI, so skip re-validation.
+    return FileSearchResponse.model_construct(
+        oid="",
+        similarity=0.0,
+        file_paths=list(_MOCK_FILE_PATHS),
+        embedding_model=model.value,
         mode=mode,
+        path_type="mock",
     )
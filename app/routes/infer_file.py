@@ -3,7 +3,9 @@ import asyncio
 from typing import List
 from pydantic import HttpUrl
 from fastapi import APIRouter, HTTPException, Body
+from fastapi.responses import StreamingResponse
 import logging
+import orjson
 from lib.utils.utilities import read_json_file, url_to_folder_name
 from lib.utils.enums import SearchMode, MatchStrength, EmbeddingModel, FilePathEntry
 from app.models.responses import FileSearchResponse
@@ -12,7 +14,7 @@ from app.services.generate_response_service import infer_file_service  # Import
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.post("/infer-file/", response_model=List[FileSearchResponse])
+@router.post("/infer-file/")
 async def infer_file(
     prompt: str = Body(..., description="The prompt to search for"),
     project: str = Body(..., description="The project to search"),
@@ -24,7 +26,7 @@ async def infer_file(
     embeddings_model_api_key: str = Body(..., description="OpenAI API key for Embeddings"),
     ignore_files: List[str] = Body(..., description="List of file to ignore"),
     head: str = Body(..., description="The head commit to checkout"),
-) -> List[FileSearchResponse]:
+):
     if not prompt.strip():
         raise HTTPException(status_code=400, detail="Prompt cannot be empty.")
 
@@ -46,4 +48,15 @@ async def infer_file(
         logger.error(f"Error during inferencing: {e}")
         raise HTTPException(status_code=500, detail="An error occurred while inferring file.")
 
-    return responses
+    async def generate():
+        # Stream the JSON array item by item so large match sets never get
+        # serialized into one contiguous buffer; the wire format is
+        # unchanged for clients.
+        yield b"["
+        for index, response in enumerate(responses):
+            if index:
+                yield b","
+            yield orjson.dumps(response.model_dump(mode="json"))
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
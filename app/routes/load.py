@@ -11,6 +11,40 @@ from lib.utils.utilities import read_json_file # <-- Import the file reader
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Indexing jobs scheduled behind /add-repository/ and /fetch-and-checkout/
+# run through one bounded queue instead of unbounded per-response background
+# tasks, so a burst of requests can't pile up concurrent load jobs; excess
+# requests are refused with 503 instead of blowing up memory.
+load_queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+_load_worker_task = None
+
+
+def enqueue_load(load_request: LoadRequest):
+    """Queue an indexing job, or raise 503 when the queue is full."""
+    try:
+        load_queue.put_nowait(load_request)
+    except asyncio.QueueFull:
+        logger.error("Load queue full; rejecting indexing job for project '%s'", load_request.project_name)
+        raise HTTPException(status_code=503, detail="Too many indexing jobs queued; retry later.")
+
+
+async def _load_worker():
+    while True:
+        load_request = await load_queue.get()
+        try:
+            await handle_load(load_request)
+        except Exception as e:
+            logger.error("Queued load job for project '%s' failed: %s", load_request.project_name, e)
+        finally:
+            load_queue.task_done()
+
+
+def start_load_worker():
+    """Start the single queue consumer; called from the startup event."""
+    global _load_worker_task
+    if _load_worker_task is None:
+        _load_worker_task = asyncio.create_task(_load_worker())
+
 @router.post("/load/")
 @router.post("/load")
 async def handle_load(load_request: LoadRequest):
@@ -22,11 +56,14 @@ async def handle_load(load_request: LoadRequest):
         git_project_path = os.path.join(DataDir.REPO.get_path(project), "git")
         repo = Repo(git_project_path)
 
-        repo.git.checkout(original_head)
+        # Git spawns subprocesses for checkout/log; keep them off the event
+        # loop so concurrent requests stay responsive.
+        await asyncio.to_thread(repo.git.checkout, original_head)
 
         # 1. Get commits from newest to oldest (standard git log behavior)
-        commit_iterator = repo.iter_commits(original_head, max_count=load_request.depth_level)
-        all_commits_newest_first = list(commit_iterator)
+        all_commits_newest_first = await asyncio.to_thread(
+            lambda: list(repo.iter_commits(original_head, max_count=load_request.depth_level))
+        )
 
         if not all_commits_newest_first:
             logger.warning("No commits to process for the given specifications.")
@@ -135,7 +172,7 @@ async def handle_load(load_request: LoadRequest):
         if repo and repo.head.commit.hexsha != original_head:
             try:
                 logger.info(f"Restoring repository to original HEAD: {original_head}")
-                repo.git.checkout(original_head)
+                await asyncio.to_thread(repo.git.checkout, original_head)
             except Exception as checkout_error:
                 logger.error(f"CRITICAL: Failed to restore repository to original HEAD: {checkout_error}")
 
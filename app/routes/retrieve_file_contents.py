@@ -1,8 +1,10 @@
 import os
 import asyncio
 import logging
-from typing import List
+from typing import List, Union
 from fastapi import APIRouter, HTTPException, Body
+from fastapi.responses import StreamingResponse
+import orjson
 from pydantic import ValidationError
 from lib.utils.utilities import url_to_folder_name
 from app.utils import retrieve_file_contents
@@ -13,12 +15,12 @@ from app.services.generate_response_service import retrieve_file_contents_servic
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-@router.post("/retrieve-file-contents/", response_model=FileContentResponse)
+@router.post("/retrieve-file-contents/")
 async def get_file_contents(
     project_name: str = Body(..., description="The name of the project"),
-    file_paths: List[FilePathEntry] = Body(..., description="A list of file paths to retrieve content for"),
+    file_paths: List[Union[FilePathEntry, str]] = Body(..., description="A list of file paths to retrieve content for, as entries or plain strings"),
     ignore_files: List[str] = Body(..., description="A list of files to ignore during retrieval")
-) -> FileContentResponse:
+):
     project_name = url_to_folder_name(project_name)
     if not project_name.strip():
         raise HTTPException(status_code=400, detail="Project name cannot be empty.")
@@ -26,7 +28,17 @@ async def get_file_contents(
     if not file_paths:
         raise HTTPException(status_code=400, detail="File paths cannot be empty.")
 
-    logger.info(f"Received file paths: {file_paths}")
+    # Accept a flat list of strings as well as the verbose
+    # [{"path": ...}] form; the flat payload is roughly half the bytes
+    # and skips one model allocation per entry.
+    file_paths = [
+        entry if isinstance(entry, FilePathEntry) else FilePathEntry(path=entry)
+        for entry in file_paths
+    ]
+
+    logger.info("Received %d file path(s)", len(file_paths))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received file paths: %s", [entry.path for entry in file_paths])
 
     try:
         file_content_response = await retrieve_file_contents_service(project_name, file_paths, ignore_files)
@@ -37,4 +49,17 @@ async def get_file_contents(
         logger.error(f"Error retrieving file contents: {e}")
         raise HTTPException(status_code=500, detail="An error occurred while retrieving file contents.")
 
-    return file_content_response
+    # File contents can run to many megabytes; stream the JSON body file by
+    # file instead of serializing everything into one in-memory blob. The
+    # wire format matches FileContentResponse exactly.
+    async def generate():
+        yield b'{"contents":{'
+        for index, (path, content) in enumerate(file_content_response.contents.items()):
+            if index:
+                yield b","
+            yield orjson.dumps(path) + b":" + orjson.dumps(content)
+        yield b'},"retrieved_file_paths":'
+        yield orjson.dumps(file_content_response.retrieved_file_paths)
+        yield b"}"
+
+    return StreamingResponse(generate(), media_type="application/json")
@@ -2,13 +2,13 @@ import os
 import asyncio
 import logging
 from lib.vcs.repo_manager import delete_store
-from lib.utils.utilities import url_to_folder_name, read_json_file
+from lib.vcs.git_commit_manager import GitCommitManager
+from lib.indexer.commit_indexer import CommitEmbeddingGenerator
+from lib.utils.utilities import url_to_folder_name, read_json_file, read_json_file_cached
 from lib.utils.enums import VCSType
 from app.utils import count_tokens
 from fastapi import APIRouter, HTTPException
 from app.utils import DataDir
-from fastapi import HTTPException
-from lib.utils.utilities import read_json_file
 from app.models.requests import CountTokenRequest, LoadRequest
 
 router = APIRouter()
@@ -64,11 +64,6 @@ async def count_tokens_load(load_request: LoadRequest):
     ignore_files = load_request.ignore_files or []
     head = load_request.head
 
-    projects = DataDir.list_projects()
-
-    all_new_commits = []
-
-
     git_project_path = os.path.join(DataDir.REPO.get_path(project), "git")
     logger.debug("%s's git repo path: %s", project, git_project_path)
 
@@ -76,7 +71,16 @@ async def count_tokens_load(load_request: LoadRequest):
     commits_logs_file_path = os.path.join(commits_logs_dir_path, "commits_logs.json")
     logger.debug("%s's commit logs file path: %s", project, commits_logs_file_path)
 
-    commits_logs_json = await asyncio.to_thread(read_json_file, commits_logs_file_path)
+    commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "commits_embeddings.json")
+
+    # Read-only estimator: share the parsed logs with the infer and load
+    # paths instead of re-parsing them. The embeddings file is not needed
+    # until after commit processing, so kick its (large, orjson) parse off
+    # now and let it run alongside the logs parse and the git work.
+    embeddings_read_task = asyncio.create_task(
+        asyncio.to_thread(read_json_file_cached, commits_embeddings_file_path)
+    )
+    commits_logs_json = await asyncio.to_thread(read_json_file_cached, commits_logs_file_path)
 
 
     parser = GitCommitManager(
@@ -100,13 +104,10 @@ async def count_tokens_load(load_request: LoadRequest):
     await parser.add_commits_and_summaries_to_log(git_project_path, depth)
     logger.critical("Completed commit processing for project '%s'", project)
 
-    new_commits_string = parser.new_commits
-
-    commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "commits_embeddings.json")
     logger.info(f"{project}'s embedded commit logs file path: {commits_embeddings_file_path}")
 
     commits_logs_json = parser.commits_logs
-    existing_commits_embeddings_json = await asyncio.to_thread(read_json_file, commits_embeddings_file_path)
+    existing_commits_embeddings_json = await embeddings_read_task
     generator = CommitEmbeddingGenerator(
         commits_logs_json,
         embeddings_model_api_key,
@@ -124,17 +125,15 @@ async def count_tokens_load(load_request: LoadRequest):
         logger.info("No new commits to count tokens for.")
         return 0, 0
 
-    # Since 'message' is now a list of messages, join them into a single string for token counting
-    new_commits_messages = ['\n'.join(commit['message']) for commit in new_commits]
-    new_commits_string = '\n'.join(new_commits_messages)  # Create a string from messages
-
-    total_embedding_tokens = count_tokens(new_commits_string)
+    # 'message' is a list of messages per commit; count each commit's joined
+    # messages directly instead of materializing one giant string first.
+    total_embedding_tokens = sum(
+        count_tokens('\n'.join(commit['message'])) for commit in new_commits
+    )
 
     # Retrieve files changed in new commits for additional token counting
-    total_inference_tokens = 0
     inference_token_count = parser.count_tokens_in_files(new_commits, project, ignore_files)
-    for file_path, count in inference_token_count.items():
-        total_inference_tokens += count
+    total_inference_tokens = sum(inference_token_count.values())
 
     # Check if total token count exceeds the limit
     max_token_count = 3_000_000
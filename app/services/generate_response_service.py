@@ -1,20 +1,47 @@
 import os
+import time
 import asyncio
 import logging
 import fnmatch  # Import fnmatch
+from collections import OrderedDict
 from typing import List, Tuple  # Import Tuple
 from pydantic import ValidationError, HttpUrl
 from app.utils import retrieve_file_contents
 from app.models.responses import FileSearchResponse, FileContentResponse
-from lib.utils.utilities import url_to_folder_name, read_json_file
+from lib.utils.utilities import url_to_folder_name, read_json_file_cached
 from lib.utils.enums import FilePathEntry
 from lib.vcs.git_commit_manager import GitCommitManager
-from lib.search.commit_embedding_matcher import CommitEmbeddingMatcher
+from lib.search.commit_embedding_matcher import get_commit_embedding_matcher
 from lib.search.file_localization import FileLocalizer
 from app.utils import DataDir
 
 logger = logging.getLogger(__name__)
 
+# Agents and retry loops tend to re-issue the exact same infer request;
+# answering those from memory skips the embedding call, the cosine scan
+# and the localization pass. Keyed on everything that shapes the result,
+# including the embeddings file's mtime so a /load/ rewrite invalidates
+# stale entries immediately rather than after the TTL.
+_infer_cache = OrderedDict()
+_INFER_CACHE_SIZE = 256
+_INFER_CACHE_TTL = 300  # seconds
+
+def _infer_cache_get(key):
+    entry = _infer_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, responses = entry
+    if time.monotonic() - stored_at > _INFER_CACHE_TTL:
+        del _infer_cache[key]
+        return None
+    _infer_cache.move_to_end(key)
+    return responses
+
+def _infer_cache_store(key, responses):
+    _infer_cache[key] = (time.monotonic(), responses)
+    if len(_infer_cache) > _INFER_CACHE_SIZE:
+        _infer_cache.popitem(last=False)
+
 async def retrieve_file_contents_service(
     project_name: str,
     file_paths: List[FilePathEntry],
@@ -22,7 +49,6 @@ async def retrieve_file_contents_service(
 ) -> FileContentResponse:
     """Service method to retrieve file contents."""
     retrieved_file_paths = []
-    contents = {}
 
     try:
         logger.critical("Starting file content retrieval for project '%s'...", project_name)
@@ -32,8 +58,7 @@ async def retrieve_file_contents_service(
         if not file_contents:
             logger.warning("No file contents retrieved for project '%s' with provided file paths: %s", project_name, file_paths)
 
-        for path in file_contents.keys():
-            retrieved_file_paths.append(path)
+        retrieved_file_paths = list(file_contents)
 
     except ValidationError as e:
         logger.critical("Validation error retrieving files for project '%s': %s", project_name, e)
@@ -99,20 +124,43 @@ async def infer_file_service(
     logger.info(f"llm base_url: {str(llm_model_base_url)}")
 
     project = url_to_folder_name(project)
+    # Resolve the enum value once instead of per response below.
+    mode_value = mode.value
 
     commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "commits_embeddings.json")
-    matcher = CommitEmbeddingMatcher(
+
+    try:
+        embeddings_mtime = os.path.getmtime(commits_embeddings_file_path)
+    except OSError:
+        embeddings_mtime = None
+    cache_key = (
+        project, prompt, mode_value, model, match_strength.value,
+        head, tuple(ignore_files or []), embeddings_mtime,
+    )
+    cached_responses = _infer_cache_get(cache_key)
+    if cached_responses is not None:
+        logger.info("Serving infer result for project '%s' from cache", project)
+        return cached_responses
+
+    # On a cache miss this loads the embedding model and builds the score
+    # matrix; keep that off the event loop.
+    matcher = await asyncio.to_thread(
+        get_commit_embedding_matcher,
         commits_embedding_filepath=commits_embeddings_file_path,
         embeddings_model_api_key=embeddings_model_api_key,
-        embedding_model_base_url=llm_model_base_url
+        embedding_model_base_url=llm_model_base_url,
     )
 
     commits_logs_dir_path = DataDir.COMMITS_LOGS.get_path(project)
     commits_logs_file_path = os.path.join(commits_logs_dir_path, "commits_logs.json")
 
-    commits_logs_json = await asyncio.to_thread(read_json_file, commits_logs_file_path)
+    # Shared, mtime-invalidated parse; the infer path only reads the log.
+    commits_logs_json = await asyncio.to_thread(read_json_file_cached, commits_logs_file_path)
     logger.info(f"infer_file_service calls GitCommitManager with head: {head}")  # Use f-string
-    parser = GitCommitManager(
+    # GitCommitManager.__init__ validates the whole log and runs a git
+    # checkout subprocess; both would otherwise block the event loop.
+    parser = await asyncio.to_thread(
+        GitCommitManager,
         commits_logs_json,
         project,
         llm_model_api_key=llm_model_api_key,
@@ -127,15 +175,22 @@ async def infer_file_service(
     logger.debug("Searching for commits closely matching prompt: '%s'...", prompt)
     closest_commit_matches = await matcher.find_closest_commits(prompt, match_strength, top_n=5)
     logger.debug("Found %d commit(s) matching prompt '%s'", len(closest_commit_matches), prompt)
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
     # --- Begin concurrent file retrieval from commits and localization ---
 
     async def commit_files():
         responses = []
         all_inferred_files_paths_before_ignore_filter = []
+        # One thread hand-off resolves every matched commit's files; the
+        # bulk lookup also dedupes worktree checks for files shared
+        # between matches.
+        files_by_match_oid = await asyncio.to_thread(
+            parser.get_files_from_commits_bulk,
+            [match["oid"] for match in closest_commit_matches],
+        )
         for match in closest_commit_matches:
-            raw_file_paths = await loop.run_in_executor(None, parser.get_files_from_commits, match["oid"])
+            raw_file_paths = files_by_match_oid[match["oid"]]
             commit_file_entries: List[FilePathEntry] = [FilePathEntry(path=fp) for fp in raw_file_paths]
             all_inferred_files_paths_before_ignore_filter.extend(commit_file_entries)
             filtered_commit_file_entries, _ = _filter_and_log_ignored_files(
@@ -147,12 +202,15 @@ async def infer_file_service(
                     similarity=match["similarity"],
                     file_paths=filtered_commit_file_entries,
                     embedding_model=model,
-                    mode=mode.value,
+                    mode=mode_value,
                     path_type='commit'
                 )
                 responses.append(response)
-        logger.info("Inferred files from commits (before ignore filter): %s",
-                     [file.path for file in all_inferred_files_paths_before_ignore_filter])
+        logger.info("Inferred %d file path(s) from commits (before ignore filter)",
+                    len(all_inferred_files_paths_before_ignore_filter))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Inferred files from commits (before ignore filter): %s",
+                         [file.path for file in all_inferred_files_paths_before_ignore_filter])
         return responses
 
     async def localization_files():
@@ -175,8 +233,9 @@ async def infer_file_service(
             localized_files_raw, _ = await loop.run_in_executor(None, file_localizer.localize_files)
             logger.debug("File localization completed for prompt '%s', found %d file(s)", prompt, len(localized_files_raw))
             localized_file_entries_unfiltered = [FilePathEntry(path=fp) for fp in localized_files_raw]
-            logger.debug("Inferred files from localization (before ignore filter): %s",
-                         [entry.path for entry in localized_file_entries_unfiltered])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Inferred files from localization (before ignore filter): %s",
+                             [entry.path for entry in localized_file_entries_unfiltered])
 
             filtered_localized_entries, _ = _filter_and_log_ignored_files(
                 localized_file_entries_unfiltered, ignore_files, "Localization"
@@ -188,7 +247,7 @@ async def infer_file_service(
                     similarity=0.0,
                     file_paths=filtered_localized_entries,
                     embedding_model=model,
-                    mode=mode.value,
+                    mode=mode_value,
                     path_type='localization'
                 )
                 responses.append(localized_response)
@@ -206,9 +265,11 @@ async def infer_file_service(
     final_responses = commit_responses + loc_responses
 
     # Log combined *final* file paths after all filtering
-    final_inferred_paths = []
-    for resp in final_responses:
-        final_inferred_paths.extend([entry.path for entry in resp.file_paths])
-    logger.debug("Combined inferred files (after ignore filter): %s", final_inferred_paths)
+    if logger.isEnabledFor(logging.DEBUG):
+        final_inferred_paths = []
+        for resp in final_responses:
+            final_inferred_paths.extend(entry.path for entry in resp.file_paths)
+        logger.debug("Combined inferred files (after ignore filter): %s", final_inferred_paths)
 
+    _infer_cache_store(cache_key, final_responses)
     return final_responses
@@ -1,31 +1,30 @@
 import os
 import logging
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, List
 from app.utils import DataDir
-from lib.utils.utilities import read_json_file, url_to_folder_name
+from lib.utils.utilities import read_json_file_cached, url_to_folder_name
 
 logger = logging.getLogger(__name__)
 
-async def fetch_summary_from_commit(file_path: str, commits_log: List[Dict]) -> Optional[Dict[str, str]]:
-    # Iterate over each commit in the commit log
+def _build_summary_index(commits_log: List[Dict]) -> Dict[str, str]:
+    """
+    Map each file path to its summary from the earliest commit in the log
+    that carries one. One pass over the log replaces a scan per requested
+    file, and a plain dict lookup replaces the old per-path async task.
+    """
+    index: Dict[str, str] = {}
     for commit in commits_log:
         files = commit.get('files', [])
         summaries = commit.get('summaries', [])
 
-        # Check if file_path is in the list of files
-        if file_path in files:
-            # Find the index of the file_path
-            index = files.index(file_path)
-            # Get the summary at the same index
-            summary = summaries[index] if index < len(summaries) else None
-
+        for position, file_path in enumerate(files):
+            if file_path in index:
+                continue
+            summary = summaries[position] if position < len(summaries) else None
             if summary:
-                return {"file_path": file_path, "summary": summary}
-            else:
-                logger.warning(f"No summary found for file path: {file_path} in commit {commit.get('oid')}")
-    logger.warning(f"No summary found for file path: {file_path}")
-    return None
+                index[file_path] = summary
+    return index
 
 async def get_file_summaries(file_paths: List[str], project_name: str) -> List[Dict[str, str]]:
     project = url_to_folder_name(project_name)
@@ -33,18 +32,17 @@ async def get_file_summaries(file_paths: List[str], project_name: str) -> List[D
     commits_logs_file_path = os.path.join(commits_logs_dir_path, "commits_logs.json")
 
     # Read the commit logs asynchronously
-    commits_log = await asyncio.to_thread(read_json_file, commits_logs_file_path)
-
-    # Create a list of async tasks for fetching summaries from the commit log
-    tasks = [fetch_summary_from_commit(file_path, commits_log) for file_path in file_paths]
-    results = await asyncio.gather(*tasks)
+    commits_log = await asyncio.to_thread(read_json_file_cached, commits_logs_file_path)
+    summary_index = await asyncio.to_thread(_build_summary_index, commits_log)
 
-    # Prepare the output, filtering out None results
-    summaries = [result for result in results if result is not None]
+    summaries = [
+        {"file_path": file_path, "summary": summary_index[file_path]}
+        for file_path in file_paths
+        if file_path in summary_index
+    ]
 
     if len(summaries) < len(file_paths):
-        missing_files = [file_path for file_path, result in zip(file_paths, results) if result is None]
-        for file_path in missing_files:
-            logger.warning(f"No summary found for file path: {file_path}")
+        missing_files = [file_path for file_path in file_paths if file_path not in summary_index]
+        logger.warning("No summary found for %d file path(s): %s", len(missing_files), ", ".join(missing_files))
 
     return summaries
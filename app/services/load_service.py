@@ -8,8 +8,7 @@ from lib.utils.utilities import (
     read_json_file,
     write_json_file,
     get_lock_file_path,
-    is_locked,
-    acquire_lock,
+    try_acquire_lock,
     release_lock,
     validate_files_embeddings,
     validate_commits_logs,
@@ -43,21 +42,19 @@ async def load_project_data(load_request: LoadRequest):
     mock_new_commits_file_path = os.path.join(commits_logs_dir_path, "mock_new_commits.json") if use_mock_llm else None
 
     lock_file_path = get_lock_file_path(project)
-    lock_file_exists, lock_time_duration = await is_locked(lock_file_path)
 
-
-    if lock_file_exists:
-        elapsed_hours = int(lock_time_duration // 3600)
-        elapsed_minutes = int((lock_time_duration % 3600) // 60)
+    # Single O_EXCL create instead of a separate existence check followed by
+    # an open — two concurrent /load/ calls can no longer both pass the
+    # check and rebuild the same index.
+    acquired, lock_time_duration = await try_acquire_lock(lock_file_path)
+    if not acquired:
+        elapsed = lock_time_duration or 0
+        elapsed_hours = int(elapsed // 3600)
+        elapsed_minutes = int((elapsed % 3600) // 60)
         logger.critical(f"Operation locked for project '{project}'. Lock active for {elapsed_hours}h {elapsed_minutes}m.")
         raise RuntimeError(f"Operation is locked for project '{project}'. Please try again later. Lock has been active for {elapsed_hours} hours and {elapsed_minutes} minutes.")
 
-    await acquire_lock(lock_file_path)
-
     try:
-        async def read_commits_logs():
-            return await asyncio.to_thread(read_json_file, commits_logs_file_path)
-
         commits_logs_json = await asyncio.to_thread(read_json_file, commits_logs_file_path)
 
         if commits_logs_json:
@@ -84,6 +81,16 @@ async def load_project_data(load_request: LoadRequest):
         )
 
 
+        commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "commits_embeddings.json")
+        mock_commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "mock_commits_embeddings.json")
+
+        # The existing embeddings store isn't needed until embedding
+        # generation below and nothing in between touches it, so overlap
+        # its (potentially multi-MB) read with the long summarization stage.
+        embeddings_read_task = asyncio.create_task(
+            asyncio.to_thread(read_json_file, commits_embeddings_file_path)
+        )
+
         logger.critical(f"Starting to add commits and summaries with depth {depth_level}.")
         await parser.add_commits_and_summaries_to_log(git_project_path, depth_level)
         logger.critical("Completed adding commits and summaries.")
@@ -127,18 +134,21 @@ async def load_project_data(load_request: LoadRequest):
                 logger.info(f"Saved mock commits_logs to {mock_commits_logs_file_path}")
                 await asyncio.to_thread(write_json_file, parser.new_commits, mock_new_commits_file_path)
                 logger.info(f"Saved mock new commits log to {mock_new_commits_file_path}")
-        else:
+        elif parser.new_commits:
             logger.info(f"New commits added: {parser.commits_logs}")
             await asyncio.to_thread(write_json_file, parser.commits_logs, commits_logs_file_path)
+        else:
+            # Nothing changed; avoid rewriting the whole log for a no-op run.
+            logger.info("No new commits; skipping commits_logs rewrite.")
 
-        commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "commits_embeddings.json")
-        mock_commits_embeddings_file_path = os.path.join(DataDir.COMMITS_EMBEDDINGS.get_path(project), "mock_commits_embeddings.json")
         logger.info(f"{project}'s embedded commit logs file path: {commits_embeddings_file_path}")
 
-        # Reload the updated commits logs
-        commits_logs_json = await read_commits_logs()
+        # parser.commits_logs is exactly what was (or would have been)
+        # written above, so feed it to the generator instead of re-reading
+        # and re-parsing the whole log from disk.
+        commits_logs_json = parser.commits_logs
 
-        existing_commits_embeddings_json = await asyncio.to_thread(read_json_file, commits_embeddings_file_path) or {}
+        existing_commits_embeddings_json = await embeddings_read_task or {}
 
         generator = CommitEmbeddingGenerator(
             commits_logs_json,
@@ -159,8 +169,10 @@ async def load_project_data(load_request: LoadRequest):
 
         if use_mock_llm:
             await asyncio.to_thread(write_json_file, updated_commits_embeddings_json, mock_commits_embeddings_file_path)
-        else:
+        elif new_commit_oids:
             await asyncio.to_thread(write_json_file, updated_commits_embeddings_json, commits_embeddings_file_path)
+        else:
+            logger.info("No new commit embeddings; skipping commits_embeddings rewrite.")
 
     finally:
         await release_lock(lock_file_path)
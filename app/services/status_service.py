@@ -23,15 +23,18 @@ async def status_service(
     """ Check if the repo.lock file is present after verifying push access. """
     project_name = url_to_folder_name(str(codehost_url))  # Use the URL to create the folder name
 
-    repo_info = await get_repo_info_async(str(codehost_url))
-    # Push access is always granted as check_push_access now returns True
-    # has_push_access = True
-
     lock_file_path = get_lock_file_path(project_name)
 
-    lock_file_exists, lock_time_duration = await is_locked(lock_file_path)
-    # Read logs for this project
-    error_logs = read_logs(project_name)
+    # The repo lookup and the lock-file stat are independent checks; run
+    # them together instead of back to back.
+    # Push access is always granted as check_push_access now returns True
+    # has_push_access = True
+    repo_info, (lock_file_exists, lock_time_duration) = await asyncio.gather(
+        get_repo_info_async(str(codehost_url)),
+        is_locked(lock_file_path),
+    )
+    # Read logs for this project without blocking the event loop.
+    error_logs = await asyncio.to_thread(read_logs, project_name)
 
     # Build status response
     result = {
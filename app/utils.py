@@ -3,6 +3,8 @@ import subprocess
 import logging
 import magic
 from enum import Enum
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from lib.utils.enums import FilePathEntry
 
@@ -20,6 +22,7 @@ class DataDir(Enum):
     CONTENT_LOGS = "contents/logs"
     CONTENT = "contents"  # New CONTENT directory
 
+    @lru_cache(maxsize=1024)
     def get_path(self, project_name: str, dir_type: 'DataDir' = None) -> str:
         """
         Gets the full path for a specific project based on the current directory type.
@@ -190,14 +193,15 @@ def retrieve_file_contents(project_name: str, file_paths: List[FilePathEntry], i
     repo_path = DataDir.REPO.get_path(project_name)
 
 
-    logger.info(f"Retrieving contents for project: {project_name}")
-    logger.debug(f"Repo path resolved as: {repo_path}")
-    logger.debug(f"Ignore files: {ignore_files}")
-    logger.debug(f"File paths: {[entry.path for entry in file_paths]}")
+    logger.info("Retrieving contents for project: %s (%d paths)", project_name, len(file_paths))
+    logger.debug("Repo path resolved as: %s", repo_path)
+    logger.debug("Ignore files: %s", ignore_files)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("File paths: %s", [entry.path for entry in file_paths])
 
     for entry in file_paths:
         full_path = os.path.join(repo_path, "git", entry.path)
-        logger.debug(f"Checking file: {full_path}")
+        logger.debug("Checking file: %s", full_path)
 
         if entry.path in ignore_files:
             logger.warning(f"Skipping ignored file: {entry.path}")
@@ -220,13 +224,13 @@ def retrieve_file_contents(project_name: str, file_paths: List[FilePathEntry], i
                 content = f.read()
                 file_contents[entry.path] = content
 
-                logger.debug(f"Successfully read file: {entry.path}")
+                logger.debug("Successfully read file: %s", entry.path)
         except UnicodeDecodeError as e:
             logger.warning(f"Unicode decode error in {entry.path}: {e}")
         except IOError as e:
             logger.error(f"I/O error reading {entry.path}: {e}")
 
-    logger.info(f"Total files retrieved: {len(file_contents)}")
+    logger.info("Total files retrieved: %d", len(file_contents))
     return file_contents
 
 def count_tokens(text: str) -> int:
@@ -264,17 +268,38 @@ def add_git_safe_directory(path: str):
 def add_all_existing_repos_as_safe(base_path: str):
     """
     Traverse all first-level dirs under base_path, and add <base>/<dir>/repo/git as safe.directory if .git exists.
+
+    The git config subprocesses run on a thread pool so startup cost stays
+    flat as the number of projects grows.
     """
     if not os.path.isdir(base_path):
         logging.warning(f"Base path does not exist: {base_path}")
         return
 
+    repo_git_paths = []
     for project in os.listdir(base_path):
         project_path = os.path.join(base_path, project)
         repo_git_path = os.path.join(project_path, "repo", "git")
         git_dir = os.path.join(repo_git_path, ".git")
         if os.path.isdir(repo_git_path) and os.path.isdir(git_dir):
-            add_git_safe_directory(repo_git_path)
+            repo_git_paths.append(repo_git_path)
+
+    if not repo_git_paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(repo_git_paths))) as executor:
+        list(executor.map(add_git_safe_directory, repo_git_paths))
+
+def _delete_repo_lock_file(project_path: str):
+    """Delete a single project's repo.lock file if present."""
+    lock_file_path = os.path.join(project_path, "repo.lock")
+    try:
+        os.remove(lock_file_path)
+        logging.info(f"Deleted lock file: {lock_file_path}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.error(f"Failed to delete lock file {lock_file_path}: {e}")
 
 def delete_all_repo_lock_files(base_path: str):
     """
@@ -284,12 +309,9 @@ def delete_all_repo_lock_files(base_path: str):
         logging.warning(f"Base path does not exist: {base_path}")
         return
 
-    for project in os.listdir(base_path):
-        project_path = os.path.join(base_path, project)
-        lock_file_path = os.path.join(project_path, "repo.lock")
-        if os.path.isfile(lock_file_path):
-            try:
-                os.remove(lock_file_path)
-                logging.info(f"Deleted lock file: {lock_file_path}")
-            except Exception as e:
-                logging.error(f"Failed to delete lock file {lock_file_path}: {e}")
+    project_paths = [os.path.join(base_path, project) for project in os.listdir(base_path)]
+    if not project_paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(project_paths))) as executor:
+        list(executor.map(_delete_repo_lock_file, project_paths))
@@ -1,12 +1,39 @@
 import logging
 from typing import List
 from pydantic import HttpUrl
-from langchain_openai import OpenAIEmbeddings
 import json
 import os
 
-from sentence_transformers import SentenceTransformer
-from transformers import AutoTokenizer  # Import AutoTokenizer
+
+# Number of texts sent per embedding request/encode call. Keeps OpenAI
+# requests under the per-request input cap while still amortizing HTTP
+# round-trips across large batches.
+EMBED_BATCH_SIZE = 128
+
+# One EmbeddingModel per (credentials, model) for the whole process. The
+# SentenceTransformer path loads model weights on construction and the
+# OpenAI path builds an HTTP client with its connection pool — both are
+# wasteful to redo for every indexing run or matcher build.
+_model_cache = {}
+
+def get_embedding_model(
+    embeddings_model_api_key: str,
+    embedding_model_base_url: HttpUrl,
+    embeddings_model: str = "all-MiniLM-L6-v2",
+    use_mock_llm: bool = False,
+) -> "EmbeddingModel":
+    """Return a shared EmbeddingModel, constructing it on first use."""
+    key = (embeddings_model_api_key, str(embedding_model_base_url), embeddings_model, use_mock_llm)
+    model = _model_cache.get(key)
+    if model is None:
+        model = EmbeddingModel(
+            embeddings_model_api_key=embeddings_model_api_key,
+            embedding_model_base_url=embedding_model_base_url,
+            embeddings_model=embeddings_model,
+            use_mock_llm=use_mock_llm,
+        )
+        _model_cache[key] = model
+    return model
 
 
 class EmbeddingModel:
@@ -36,6 +63,10 @@ class EmbeddingModel:
 
         if not use_mock_llm:
             if embeddings_model == "text-embedding-3-large":
+                # Imported here so workers that never touch the OpenAI path
+                # (or never embed at all) skip the langchain import at boot.
+                from langchain_openai import OpenAIEmbeddings
+
                 # Use OpenAI for this specific model
                 self.embeddings_model_api_key = embeddings_model_api_key
                 self.embedding_generator = OpenAIEmbeddings(
@@ -44,6 +75,12 @@ class EmbeddingModel:
                     model=embeddings_model
                 )
             else:
+                # sentence_transformers pulls in torch; defer that multi-second
+                # import until a local model is actually constructed.
+                from sentence_transformers import SentenceTransformer
+                from transformers import AutoTokenizer
+
+                device = self._detect_device()
 
                 # Use HuggingFace directly for all-MiniLM-L6-v2 instead of local path
                 if embeddings_model == "all-MiniLM-L6-v2":
@@ -53,13 +90,13 @@ class EmbeddingModel:
                     cache_dir = "/data/users/models/cache"
                     os.makedirs(cache_dir, exist_ok=True)
 
-                    self.logger.info(f"Loading model from HuggingFace with caching at {cache_dir}")
+                    self.logger.info(f"Loading model from HuggingFace with caching at {cache_dir} on device {device}")
                     # Change cache_dir to cache_folder
-                    self.sentence_transformer = SentenceTransformer(model_name, cache_folder=cache_dir)
+                    self.sentence_transformer = SentenceTransformer(model_name, cache_folder=cache_dir, device=device)
                     self.tokenizer = AutoTokenizer.from_pretrained(model_name, cache_dir=cache_dir)
                 else:
                     # For any other model, load it normally
-                    self.sentence_transformer = SentenceTransformer(embeddings_model)
+                    self.sentence_transformer = SentenceTransformer(embeddings_model, device=device)
                     self.tokenizer = AutoTokenizer.from_pretrained(embeddings_model)
         else:
             self.logger.debug("Using mock LLM for embedding generation.")
@@ -69,6 +106,19 @@ class EmbeddingModel:
 
 
 
+    def _detect_device(self) -> str:
+        """
+        Pick the device for SentenceTransformer encoding: CUDA when a GPU
+        is visible, otherwise CPU.
+        """
+        try:
+            import torch
+            if torch.cuda.is_available():
+                return "cuda"
+        except ImportError:
+            self.logger.warning("torch not importable; defaulting to CPU for embeddings.")
+        return "cpu"
+
     def _truncate_text_to_max_tokens(self, text: str) -> str:
         """
         Truncate the text to fit within the maximum token limit.
@@ -188,12 +238,16 @@ class EmbeddingModel:
 
         else:
             if self.embeddings_model == "text-embedding-3-large":
-                # Generate embeddings using OpenAI API
-                embeddings = self.embedding_generator.embed_documents(texts_to_embed)
+                # Generate embeddings using the OpenAI API, batching the inputs
+                # so each request stays well under the endpoint's input limits.
+                embeddings = []
+                for start in range(0, len(texts_to_embed), EMBED_BATCH_SIZE):
+                    batch = texts_to_embed[start:start + EMBED_BATCH_SIZE]
+                    embeddings.extend(self.embedding_generator.embed_documents(batch))
                 self.logger.debug(f"Generated embeddings for {len(texts_to_embed)} texts using OpenAI API.")
             else:
                 # Generate embeddings using SentenceTransformer
-                embeddings = self.sentence_transformer.encode(texts_to_embed, normalize_embeddings=True).tolist()
+                embeddings = self.sentence_transformer.encode(texts_to_embed, batch_size=EMBED_BATCH_SIZE, convert_to_numpy=True, normalize_embeddings=True).tolist()
                 self.logger.debug(f"Generated embeddings for {len(texts_to_embed)} texts using SentenceTransformer.")
         return embeddings
 
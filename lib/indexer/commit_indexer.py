@@ -2,7 +2,7 @@ import time
 import logging
 from typing import Dict, List, Union
 from pydantic import HttpUrl
-from lib.ai.embeddings_model import EmbeddingModel
+from lib.ai.embeddings_model import get_embedding_model
 from lib.utils.utilities import validate_commits_embeddings
 
 class CommitEmbeddingGenerator:
@@ -18,7 +18,7 @@ class CommitEmbeddingGenerator:
         # Use EmbeddingModel instead of OpenAIEmbeddings
 
         self.logger.info(f"Constructing CommitEmbeddingGenerator with use_mock_llm: {self.use_mock_llm}")
-        self.embedding_generator = EmbeddingModel(
+        self.embedding_generator = get_embedding_model(
             embeddings_model_api_key=self.embeddings_model_api_key,
             embedding_model_base_url=embeddings_model_base_url,
             embeddings_model=self.embeddings_model,
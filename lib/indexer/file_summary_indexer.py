@@ -4,7 +4,7 @@ import logging
 import json
 from pydantic import HttpUrl
 from fastapi import HTTPException
-from lib.ai.embeddings_model import EmbeddingModel
+from lib.ai.embeddings_model import get_embedding_model
 from lib.vcs.git_content_manager import GitContentManager
 from app.utils import DataDir
 from lib.ai.llm_model import LlmModel
@@ -46,7 +46,7 @@ class FileSummaryGenerator:
         self.use_mock_llm = use_mock_llm
 
         self.logger.info(f"Constructing FileSummaryGenerator with use_mock_llm: {self.use_mock_llm}")
-        self.embedding_generator = EmbeddingModel(embeddings_model_api_key=self.embeddings_model_api_key, embedding_model_base_url=llm_model_base_url, embeddings_model=embeddings_model, use_mock_llm=self.use_mock_llm)
+        self.embedding_generator = get_embedding_model(embeddings_model_api_key=self.embeddings_model_api_key, embedding_model_base_url=llm_model_base_url, embeddings_model=embeddings_model, use_mock_llm=self.use_mock_llm)
 
         self.existing_file_embeddings = existing_files_embeddings if existing_files_embeddings is not None else {}
         self.logger.info(f"Loaded {len(self.existing_file_embeddings)} existing file embeddings.")
@@ -3,21 +3,72 @@ import json
 import numpy as np
 from dotenv import load_dotenv
 from lib.utils.enums import MatchStrength
-from lib.ai.embeddings_model import EmbeddingModel
+from lib.ai.embeddings_model import get_embedding_model
 from typing import List
 from pydantic import HttpUrl
 import logging
 import asyncio  # Import asyncio for asynchronous operations
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Query prompts repeat often (retries, pagination, the same question asked
+# against several projects), and each embed call is either a model forward
+# pass or a network round trip. Cache prompt embeddings per model name.
+_prompt_embedding_cache = OrderedDict()
+_PROMPT_EMBEDDING_CACHE_SIZE = 1024
+
+# Matchers are expensive to build (embedding model load + matrix build), so
+# keep one per embeddings file and rebuild only when the file changes.
+_matcher_cache = {}
+
+def get_commit_embedding_matcher(
+    commits_embedding_filepath: str,
+    embeddings_model_api_key: str,
+    embedding_model_base_url: HttpUrl,
+    embeddings_model: str = "all-MiniLM-L6-v2",
+) -> "CommitEmbeddingMatcher":
+    """
+    Return a cached CommitEmbeddingMatcher for the given embeddings file.
+
+    The cache is keyed by file path, credentials and model, and invalidated
+    by the file's mtime so a matcher built before a /load/ rewrite is
+    discarded on the next request.
+    """
+    try:
+        mtime = os.path.getmtime(commits_embedding_filepath)
+    except OSError:
+        mtime = None
+
+    key = (commits_embedding_filepath, embeddings_model_api_key, str(embedding_model_base_url), embeddings_model)
+    cached = _matcher_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    matcher = CommitEmbeddingMatcher(
+        commits_embedding_filepath=commits_embedding_filepath,
+        embeddings_model_api_key=embeddings_model_api_key,
+        embedding_model_base_url=embedding_model_base_url,
+        embeddings_model=embeddings_model,
+    )
+    _matcher_cache[key] = (mtime, matcher)
+    return matcher
+
 class CommitEmbeddingMatcher:
     def __init__(self, commits_embedding_filepath: str, embeddings_model_api_key: str, embedding_model_base_url: HttpUrl, embeddings_model: str = "all-MiniLM-L6-v2"):
         # Set up your OpenAI API key
         if embeddings_model_api_key:
             self.embeddings_model_api_key = embeddings_model_api_key
-            self.embedding_generator = EmbeddingModel(embeddings_model_api_key=self.embeddings_model_api_key, embedding_model_base_url=embedding_model_base_url, embeddings_model=embeddings_model)
-            self.embeddings_dict = self.load_embeddings(commits_embedding_filepath)
+            self.embeddings_model = embeddings_model
+            self.embedding_generator = get_embedding_model(embeddings_model_api_key=self.embeddings_model_api_key, embedding_model_base_url=embedding_model_base_url, embeddings_model=embeddings_model)
+            if self._load_matrix_cache(commits_embedding_filepath):
+                # Matrix served straight from the binary sidecar; the JSON
+                # is only needed to (re)build the cache.
+                self.embeddings_dict = {}
+            else:
+                self.embeddings_dict = self.load_embeddings(commits_embedding_filepath)
+                self._build_matrix()
+                self._save_matrix_cache(commits_embedding_filepath)
         else:
             raise ValueError("OpenAI API key not found. Please set it in the environment or pass it explicitly.")
 
@@ -35,28 +86,137 @@ class CommitEmbeddingMatcher:
             logger.error(f"An unexpected error occurred while loading embeddings: {e}")
             raise
 
+    @staticmethod
+    def _matrix_cache_paths(filepath: str) -> tuple:
+        """Sidecar paths for the binary matrix cache next to the JSON file."""
+        base = os.path.splitext(filepath)[0]
+        return f"{base}.npy", f"{base}.meta.json"
+
+    def _load_matrix_cache(self, filepath: str) -> bool:
+        """
+        Load the fp16 matrix sidecar if it is newer than the JSON file.
+        Returns True when the matrix and its row mapping were restored,
+        avoiding the full JSON parse on warm starts.
+        """
+        self._matrix = None
+        matrix_path, meta_path = self._matrix_cache_paths(filepath)
+        try:
+            if not (os.path.exists(matrix_path) and os.path.exists(meta_path)):
+                return False
+            if os.path.getmtime(matrix_path) < os.path.getmtime(filepath):
+                return False
+
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+
+            # Memory-mapped so the kernel pages vectors in on demand; the
+            # fp16 rows are promoted to float32 during the query matmul.
+            matrix = np.load(matrix_path, mmap_mode='r')
+            self._oids = meta["oids"]
+            self._row_oid_indices = np.asarray(meta["row_oid_indices"])
+            self._matrix = matrix
+            self._row_norms = np.linalg.norm(matrix.astype(np.float32), axis=1)
+            logger.info(f"Loaded commit embedding matrix cache from {matrix_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load matrix cache for {filepath}: {e}")
+            self._matrix = None
+            return False
+
+    def _save_matrix_cache(self, filepath: str):
+        """Persist the matrix as fp16 with a JSON meta sidecar (best effort)."""
+        if self._matrix is None:
+            return
+        matrix_path, meta_path = self._matrix_cache_paths(filepath)
+        try:
+            np.save(matrix_path, self._matrix.astype(np.float16))
+            with open(meta_path, 'w') as f:
+                json.dump({"oids": self._oids, "row_oid_indices": self._row_oid_indices.tolist()}, f)
+            logger.info(f"Saved commit embedding matrix cache to {matrix_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save matrix cache for {filepath}: {e}")
+
+    def _build_matrix(self):
+        """
+        Stack every embedding vector across all commits into one float32
+        matrix so a query is a single matmul instead of a Python loop.
+        Each row maps back to its commit through self._row_oid_indices.
+        """
+        self._oids = list(self.embeddings_dict.keys())
+        self._matrix = None
+
+        rows = []
+        row_oid_indices = []
+        for index, oid in enumerate(self._oids):
+            for embedding in self.embeddings_dict[oid]["embeddings"]:
+                rows.append(embedding)
+                row_oid_indices.append(index)
+
+        if not rows:
+            return
+
+        try:
+            self._matrix = np.asarray(rows, dtype=np.float32)
+        except ValueError:
+            # Mixed embedding dimensions (e.g. mock vectors alongside real
+            # ones); keep the per-vector fallback path instead.
+            logger.warning("Embeddings have inconsistent dimensions; falling back to per-vector scan.")
+            return
+
+        self._row_oid_indices = np.asarray(row_oid_indices)
+        self._row_norms = np.linalg.norm(self._matrix, axis=1)
+
     def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
 
+    async def _embed_query(self, input_text: str) -> list:
+        """Embed a query prompt, reusing a cached vector for repeated prompts."""
+        cache_key = (self.embeddings_model, input_text)
+        cached = _prompt_embedding_cache.get(cache_key)
+        if cached is not None:
+            _prompt_embedding_cache.move_to_end(cache_key)
+            return cached
+
+        embedding = await asyncio.to_thread(self.embedding_generator.embed_text, input_text)
+        _prompt_embedding_cache[cache_key] = embedding
+        if len(_prompt_embedding_cache) > _PROMPT_EMBEDDING_CACHE_SIZE:
+            _prompt_embedding_cache.popitem(last=False)
+        return embedding
+
     async def find_closest_commits(self, input_text: str, match_strength: MatchStrength, top_n: int = 10) -> list:
         logger.warning("Using the host's OpenAI API key for finding closest commits.")
-        input_embedding = await asyncio.to_thread(self.embedding_generator.embed_text, input_text)
+        input_embedding = await self._embed_query(input_text)
         min_similarity = match_strength.get_min_similarity()
 
         matches = []
 
-        # Iterate over each commit's entry.
-        # Each entry now contains a list of embeddings under the key "embeddings".
-        for oid, value in self.embeddings_dict.items():
-            embeddings = value["embeddings"]
+        if self._matrix is not None:
+            query = np.asarray(input_embedding, dtype=np.float32)
+            similarities = (self._matrix @ query) / (self._row_norms * np.linalg.norm(query))
+
+            # A commit may carry several embeddings (message plus summaries);
+            # score each commit by its best-matching vector.
+            per_oid = np.full(len(self._oids), -np.inf, dtype=np.float32)
+            np.maximum.at(per_oid, self._row_oid_indices, similarities)
+
+            matches = [
+                {"oid": oid, "similarity": float(similarity)}
+                for oid, similarity in zip(self._oids, per_oid)
+                if similarity >= min_similarity
+            ]
+        else:
+            # Iterate over each commit's entry.
+            # Each entry now contains a list of embeddings under the key "embeddings".
+            for oid, value in self.embeddings_dict.items():
+                embeddings = value["embeddings"]
 
-            # Compute the similarity for each embedding in the list
-            # and select the maximum similarity.
-            max_similarity = max(self.cosine_similarity(input_embedding, emb) for emb in embeddings)
+                # Compute the similarity for each embedding in the list
+                # and select the maximum similarity.
+                max_similarity = max(self.cosine_similarity(input_embedding, emb) for emb in embeddings)
 
-            # If the maximum similarity meets the threshold, add this commit.
-            if max_similarity >= min_similarity:
-                matches.append({"oid": oid, "similarity": max_similarity})
+                # If the maximum similarity meets the threshold, add this commit.
+                if max_similarity >= min_similarity:
+                    matches.append({"oid": oid, "similarity": max_similarity})
 
         # Sort matches by similarity in descending order and return the top_n matches.
         matches.sort(key=lambda x: x["similarity"], reverse=True)
@@ -2,7 +2,6 @@ import os
 import json
 import numpy as np
 from dotenv import load_dotenv
-from langchain_openai import OpenAIEmbeddings
 from lib.utils.enums import MatchStrength
 from typing import List
 import logging
@@ -14,9 +13,20 @@ class FileEmbeddingMatcher:
     def __init__(self, embeddings_file: str, api_key: str, model: str = "all-MiniLM-L6-v2"):
         # Set up your OpenAI API key
         if api_key:
+            # Deferred so importing this module doesn't pay the langchain
+            # import; the client is only needed when a matcher is built.
+            from langchain_openai import OpenAIEmbeddings
+
             self.llm_model_api_key = api_key
             self.embedding_generator = OpenAIEmbeddings(openai_api_key=self.llm_model_api_key, model=model)
-            self.embeddings_dict = self.load_embeddings(embeddings_file)
+            if self._load_matrix_cache(embeddings_file):
+                # Matrix served from the binary sidecar; the JSON is only
+                # needed to (re)build the cache.
+                self.embeddings_dict = {}
+            else:
+                self.embeddings_dict = self.load_embeddings(embeddings_file)
+                self._build_matrix()
+                self._save_matrix_cache(embeddings_file)
         else:
             raise ValueError("OpenAI API key not found. Please set it in the environment or pass it explicitly.")
 
@@ -24,6 +34,72 @@ class FileEmbeddingMatcher:
         with open(filepath, 'r') as f:
             return json.load(f)
 
+    @staticmethod
+    def _matrix_cache_paths(filepath: str) -> tuple:
+        """Sidecar paths for the binary matrix cache next to the JSON file."""
+        base = os.path.splitext(filepath)[0]
+        return f"{base}.npy", f"{base}.meta.json"
+
+    def _load_matrix_cache(self, filepath: str) -> bool:
+        """
+        Load the fp16 matrix sidecar if it is newer than the JSON file,
+        skipping the full JSON parse on warm starts.
+        """
+        self._matrix = None
+        matrix_path, meta_path = self._matrix_cache_paths(filepath)
+        try:
+            if not (os.path.exists(matrix_path) and os.path.exists(meta_path)):
+                return False
+            if os.path.getmtime(matrix_path) < os.path.getmtime(filepath):
+                return False
+
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+
+            matrix = np.load(matrix_path, mmap_mode='r')
+            self._paths = meta["paths"]
+            self._matrix = matrix
+            self._row_norms = np.linalg.norm(matrix.astype(np.float32), axis=1)
+            logger.info(f"Loaded file embedding matrix cache from {matrix_path}")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load matrix cache for {filepath}: {e}")
+            self._matrix = None
+            return False
+
+    def _save_matrix_cache(self, filepath: str):
+        """Persist the matrix as fp16 with a JSON meta sidecar (best effort)."""
+        if self._matrix is None:
+            return
+        matrix_path, meta_path = self._matrix_cache_paths(filepath)
+        try:
+            np.save(matrix_path, self._matrix.astype(np.float16))
+            with open(meta_path, 'w') as f:
+                json.dump({"paths": self._paths}, f)
+            logger.info(f"Saved file embedding matrix cache to {matrix_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save matrix cache for {filepath}: {e}")
+
+    def _build_matrix(self):
+        """
+        Stack the per-file embeddings into one float32 matrix so a query
+        scores every file with a single matmul instead of a Python loop.
+        """
+        self._paths = list(self.embeddings_dict.keys())
+        self._matrix = None
+
+        rows = [self.embeddings_dict[path]["embedding"] for path in self._paths]
+        if not rows:
+            return
+
+        try:
+            self._matrix = np.asarray(rows, dtype=np.float32)
+        except ValueError:
+            logger.warning("File embeddings have inconsistent dimensions; falling back to per-vector scan.")
+            return
+
+        self._row_norms = np.linalg.norm(self._matrix, axis=1)
+
     def cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
         return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
 
@@ -34,12 +110,21 @@ class FileEmbeddingMatcher:
 
         matches = []
 
-        for oid, value in self.embeddings_dict.items():
-            embedding = value["embedding"]
-            similarity = self.cosine_similarity(input_embedding, embedding)
+        if self._matrix is not None:
+            query = np.asarray(input_embedding, dtype=np.float32)
+            similarities = (self._matrix @ query) / (self._row_norms * np.linalg.norm(query))
+            matches = [
+                {"path": path, "similarity": float(similarity)}
+                for path, similarity in zip(self._paths, similarities)
+                if similarity >= min_similarity
+            ]
+        else:
+            for oid, value in self.embeddings_dict.items():
+                embedding = value["embedding"]
+                similarity = self.cosine_similarity(input_embedding, embedding)
 
-            if similarity >= min_similarity:
-                matches.append({"path": oid, "similarity": similarity})
+                if similarity >= min_similarity:
+                    matches.append({"path": oid, "similarity": similarity})
 
         # Sort matches by similarity in descending order
         matches.sort(key=lambda x: x["similarity"], reverse=True)
@@ -1,7 +1,10 @@
 import re
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from urllib.parse import urlparse, unquote
 import json
+import orjson
 import os
 import asyncio
 import subprocess
@@ -94,26 +97,79 @@ def read_json_file(file_path):
     If the file doesn't exist or an error occurs, it returns an empty dictionary.
     """
     try:
-        with open(file_path, 'r') as file:
-            data = json.load(file)
-            return data
+        with open(file_path, 'rb') as file:
+            return orjson.loads(file.read())
     except FileNotFoundError:
         logger.warning(f"File {file_path} not found. Returning an empty dictionary.")
         return {}  # Change here to return an empty dictionary instead of a list
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Error decoding JSON from {file_path}: {e}")
         return {}  # Also return an empty dictionary on JSON error
 
+# Parsed-JSON cache for hot read-only files (commits_logs.json is re-read on
+# every infer request). Keyed by path, invalidated by the file's mtime, so a
+# rewrite from /load/ is picked up on the next read.
+_json_file_cache = OrderedDict()
+_JSON_FILE_CACHE_SIZE = 64
+
+def _stat_key(file_path):
+    """Cheap change detector for a file: (mtime_ns, size), or None."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _cache_store(file_path, stat_key, data):
+    _json_file_cache[file_path] = (stat_key, data)
+    if len(_json_file_cache) > _JSON_FILE_CACHE_SIZE:
+        _json_file_cache.popitem(last=False)
+
+def read_json_file_cached(file_path):
+    """
+    Like read_json_file, but reuses the parsed object while the file on disk
+    is unchanged (same mtime and size). Callers must treat the returned
+    object as read-only: it is shared across requests.
+    """
+    stat_key = _stat_key(file_path)
+    if stat_key is None:
+        return read_json_file(file_path)
+
+    cached = _json_file_cache.get(file_path)
+    if cached is not None and cached[0] == stat_key:
+        _json_file_cache.move_to_end(file_path)
+        return cached[1]
+
+    data = read_json_file(file_path)
+    _cache_store(file_path, stat_key, data)
+    return data
+
 def write_json_file(data, file_path):
     """
     Writes a Python object to a JSON file.
     If the file doesn't exist, it creates it.
     """
+    tmp_file_path = f"{file_path}.tmp"
     try:
-        with open(file_path, 'w') as file:
-            json.dump(data, file, indent=2)
+        # Write to a sibling temp file and rename into place so readers
+        # (and the mtime-keyed cache) never observe a torn, half-written
+        # store if the process dies mid-write.
+        with open(tmp_file_path, 'wb') as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file_path, file_path)
     except IOError as e:
         logger.error(f"Error writing to file {file_path}: {e}")
+        try:
+            os.remove(tmp_file_path)
+        except OSError:
+            pass
+        return
+
+    # Write through to the parsed-JSON cache so the next cached read reuses
+    # the object we just serialized instead of re-parsing it from disk.
+    stat_key = _stat_key(file_path)
+    if stat_key is not None:
+        _cache_store(file_path, stat_key, data)
 
 def validate_auth_url(auth_url: str) -> bool:
     """
@@ -140,6 +196,7 @@ def validate_auth_url(auth_url: str) -> bool:
 
 
 
+@lru_cache(maxsize=1024)
 def url_to_folder_name(repo_url: str) -> str:
     # Normalize the repository URL by stripping unwanted characters
     repo_url = repo_url.rstrip('/')
@@ -192,6 +249,40 @@ async def acquire_lock(lock_file_path: str):
     # Open the lock file to acquire the lock
     await asyncio.to_thread(open, lock_file_path, 'w')
 
+async def try_acquire_lock(lock_file_path: str) -> tuple:
+    """
+    Atomically acquire the lock with a single O_CREAT|O_EXCL open, closing
+    the check-then-create race between is_locked and acquire_lock. Returns
+    (acquired, elapsed_seconds): elapsed is how long the current holder has
+    held the lock when acquisition fails. Locks older than two hours are
+    treated as stale (matching is_locked) and broken.
+    """
+    def _try_once() -> bool:
+        try:
+            fd = os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return True
+        except FileExistsError:
+            return False
+
+    def _attempt() -> tuple:
+        if _try_once():
+            return (True, None)
+        try:
+            elapsed_time = time.time() - os.path.getctime(lock_file_path)
+        except OSError:
+            # Holder released between the failed open and the stat; retry.
+            return (_try_once(), None)
+        if elapsed_time > 7200:  # 7200 seconds = 2 hours
+            try:
+                os.remove(lock_file_path)
+            except OSError:
+                pass
+            return (_try_once(), None)
+        return (False, elapsed_time)
+
+    return await asyncio.to_thread(_attempt)
+
 async def release_lock(lock_file_path: str):
     """Release a lock by removing the lock file."""
     if os.path.exists(lock_file_path):
@@ -202,24 +293,6 @@ def get_lock_file_path(project_name: str) -> str:
     """Get the path for the lock file based on the project name."""
     return os.path.join(DataDir.STORE.get_path(project_name), "repo.lock")
 
-def delete_all_repo_lock_files(base_path: str):
-    """
-    Deletes all repo.lock files in each project directory under the given base path.
-    """
-    if not os.path.isdir(base_path):
-        logging.warning(f"Base path does not exist: {base_path}")
-        return
-
-    for project in os.listdir(base_path):
-        project_path = os.path.join(base_path, project)
-        lock_file_path = os.path.join(project_path, "repo.lock")
-        if os.path.isfile(lock_file_path):
-            try:
-                os.remove(lock_file_path)
-                logging.info(f"Deleted lock file: {lock_file_path}")
-            except Exception as e:
-                logging.error(f"Failed to delete lock file {lock_file_path}: {e}")
-
 def construct_remote_url(codehost_url: HttpUrl, api_key: Optional[SecretStr] = None) -> str:
     """
     Constructs the remote URL, embedding the API key if provided.
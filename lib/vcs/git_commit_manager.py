@@ -19,6 +19,7 @@ from app.utils import (
 
 from lib.utils.utilities import (
     read_json_file,
+    write_json_file,
     validate_files_embeddings,
     validate_commits_logs,
 )
@@ -388,21 +389,59 @@ class GitCommitManager:
     #        logger.error(f"Error checking if file {file_path} was deleted: {e}")
     #        return False  # Default to False if there's an error
 
+    def _files_by_oid(self):
+        """
+        oid -> files mapping over commits_logs, built lazily and rebuilt if
+        commits_logs is replaced (e.g. after new commits are prepended).
+        """
+        if getattr(self, '_files_by_oid_map', None) is None or self._files_by_oid_source is not self.commits_logs:
+            self._files_by_oid_map = {
+                commit.get('oid'): commit.get('files', []) for commit in self.commits_logs
+            }
+            self._files_by_oid_source = self.commits_logs
+        return self._files_by_oid_map
+
     def get_files_from_commits(self, oid):
         start_time = time.time()
-        for commit in self.commits_logs:
-            if commit.get('oid') == oid:
-                files = commit.get('files', [])
-                existing_files = []
-                for file in files:
-                    if not self.is_file_deleted(file):
-                        existing_files.append(file)
-                    else:
-                        logger.debug(f"File {file} was deleted. Skipping.")
-                elapsed_time = time.time() - start_time
-                logger.critical(f"get_files_from_commits completed in {elapsed_time:.2f} seconds")
-                return existing_files
-        return []
+        files = self._files_by_oid().get(oid)
+        if files is None:
+            return []
+        existing_files = []
+        for file in files:
+            if not self.is_file_deleted(file):
+                existing_files.append(file)
+            else:
+                logger.debug(f"File {file} was deleted. Skipping.")
+        elapsed_time = time.time() - start_time
+        logger.critical(f"get_files_from_commits completed in {elapsed_time:.2f} seconds")
+        return existing_files
+
+    def get_files_from_commits_bulk(self, oids):
+        """
+        Resolve several oids' file lists in one pass, sharing the worktree
+        existence checks across commits that touch the same files. Returns
+        {oid: [files]} preserving each commit's file order.
+        """
+        files_by_oid = self._files_by_oid()
+        deleted_cache = {}
+        results = {}
+        for oid in oids:
+            files = files_by_oid.get(oid)
+            if files is None:
+                results[oid] = []
+                continue
+            existing_files = []
+            for file in files:
+                deleted = deleted_cache.get(file)
+                if deleted is None:
+                    deleted = self.is_file_deleted(file)
+                    deleted_cache[file] = deleted
+                if not deleted:
+                    existing_files.append(file)
+                else:
+                    logger.debug(f"File {file} was deleted. Skipping.")
+            results[oid] = existing_files
+        return results
 
     def count_tokens_in_files(self, new_commits, project_name: str, ignore_files: List[str]):
         start_time = time.time()
@@ -415,25 +454,55 @@ class GitCommitManager:
         token_counts = {}
         repo_path = DataDir.REPO.get_path(project_name)
 
+        # Persisted per-file counts keyed by mtime, so warm calls only read
+        # and count files that changed since the last run.
+        token_counts_file_path = os.path.join(DataDir.CONTENT.get_path(project_name), "token_counts.json")
+        cached_counts = read_json_file(token_counts_file_path)
+        if not isinstance(cached_counts, dict):
+            cached_counts = {}
+        cache_dirty = False
+
+        # Collect the unique existing files across all new commits so a file
+        # touched by several commits is read and counted once.
+        files_to_count = []
+        seen_files = set()
         for commit in new_commits:
-            files = commit.get('files', [])
-            existing_files = []
-
-            for file_path in files:
+            for file_path in commit.get('files', []):
+                if file_path in seen_files:
+                    continue
+                seen_files.add(file_path)
+                # Mirror retrieve_file_contents' ignore filter so cached
+                # counts for ignored files never reach the total.
+                if file_path in ignore_files:
+                    logger.debug(f"Skipping ignored file: {file_path}")
+                    continue
                 full_path = os.path.join(repo_path, "git", file_path)
-                if os.path.isfile(full_path):
-                    existing_files.append(FilePathEntry(path=file_path))
-                else:
+                if not os.path.isfile(full_path):
                     logger.error(f"File does not exist: {full_path}")
+                    continue
 
-            # Retrieve the contents of existing files
-            file_contents = retrieve_file_contents(project_name, existing_files, ignore_files)
+                mtime_ns = os.stat(full_path).st_mtime_ns
+                cached = cached_counts.get(file_path)
+                if cached and cached[0] == mtime_ns:
+                    token_counts[file_path] = cached[1]
+                else:
+                    files_to_count.append((FilePathEntry(path=file_path), mtime_ns))
+
+        if files_to_count:
+            file_contents = retrieve_file_contents(
+                project_name, [entry for entry, _ in files_to_count], ignore_files
+            )
+            mtimes = {entry.path: mtime_ns for entry, mtime_ns in files_to_count}
 
-            # Count tokens for each file content
             for file_path, content in file_contents.items():
                 tokens = count_tokens(content)
                 token_counts[file_path] = tokens
-                logger.info(f"Counted {tokens} tokens in file: {file_path}")
+                cached_counts[file_path] = [mtimes[file_path], tokens]
+                cache_dirty = True
+                logger.debug("Counted %d tokens in file: %s", tokens, file_path)
+
+        if cache_dirty:
+            write_json_file(cached_counts, token_counts_file_path)
 
         elapsed_time = time.time() - start_time
         logger.critical(f"count_tokens_in_files completed in {elapsed_time:.2f} seconds")
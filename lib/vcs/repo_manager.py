@@ -25,7 +25,7 @@ logger = logging.getLogger(__name__)
 
 async def async_exists(path: str) -> bool:
     """Asynchronously check if a path exists."""
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     return await loop.run_in_executor(None, os.path.exists, path)
 
 async def get_repo_info_async(project_name: str):